@@ -1,11 +1,17 @@
+import logging
+
 from .agent  import Agent
 from .group  import Group
 from .tool   import Tool, Workspace
 from .event  import Event
 from .schema import Endpoint
+from .cache  import LLMCache
 from .mcp    import MCP
 from .model  import Model, modelize
 
 from .dashboard  import Dashboard
 
+# Library log records are dropped unless the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __version__ = '0.1.4'
@@ -3,24 +3,91 @@ import json
 import jinja2
 import copy
 import time
+import logging
 import concurrent.futures
 from typing import List, Dict, Any, Optional, Union, Iterator
 from functools import partial
 
 from .schema import Endpoint, Response # Import Response
-from .tool   import Tool, EndTaskTool
+from .tool   import Tool, END_TASK_TOOL
 from .event  import Event, EventBroker
-from .utils  import model_id
+from .utils  import model_id, json_dumps
 from .service import Service # Import the Service factory
 from .schema import Endpoint
-from .tool   import Tool, EndTaskTool, Workspace
+from .tool   import Tool, END_TASK_TOOL, Workspace
 from .event  import Event, EventBroker
 from .utils  import model_id
 from .mutilmodal import get_input_processor
+from .cache  import LLMCache
+from .utils.parser import IncrementalJsonFieldParser
+
+logger = logging.getLogger(__name__)
+
+# The default prompt template ships in the prompts/ folder next to this module
+_PROMPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'prompts')
+_DEFAULT_PROMPT_TEMPLATE_PATH = os.path.join(_PROMPTS_DIR, 'default_agent_prompt.md')
 
 # IncrementalXmlParser is no longer needed here as service handles parsing
 # from .utils.parser import IncrementalXmlParser
 
+# Compiled prompt templates are shared by every Agent in the process, so a
+# template is only loaded and compiled once per (directory, filename).
+_ENV_CACHE: Dict[str, jinja2.Environment] = {}
+_TEMPLATE_CACHE: Dict[tuple, jinja2.Template] = {}
+_PROMPT_FILE_CACHE: Dict[str, str] = {}
+
+
+def _get_template(template_dir: str, template_filename: str) -> jinja2.Template:
+    """Returns the compiled template for a file, compiling it on first use.
+
+    Args:
+        template_dir (str): The directory containing the template.
+        template_filename (str): The file name of the template.
+
+    Returns:
+        jinja2.Template: The compiled template.
+
+    Raises:
+        jinja2.TemplateNotFound: If the template file does not exist.
+    """
+    key = (template_dir, template_filename)
+    template = _TEMPLATE_CACHE.get(key)
+    if template is None:
+        env = _ENV_CACHE.get(template_dir)
+        if env is None:
+            env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(template_dir),
+                trim_blocks=True, # Automatically remove the first newline after a template tag
+                lstrip_blocks=True, # Automatically remove leading spaces before a template tag
+                auto_reload=False, # Prompt templates are read-only at runtime, skip the stat on each load
+                cache_size=400
+            )
+            _ENV_CACHE[template_dir] = env
+        template = env.get_template(template_filename)
+        _TEMPLATE_CACHE[key] = template
+    return template
+
+
+def _read_prompt_file(path: str) -> str:
+    """Returns the contents of a static prompt file, reading it from disk only once.
+
+    Args:
+        path (str): The path of the prompt file.
+
+    Returns:
+        str: The file contents.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    content = _PROMPT_FILE_CACHE.get(path)
+    if content is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        _PROMPT_FILE_CACHE[path] = content
+    return content
+
+
 class Agent:
     def __init__(
         self,
@@ -34,7 +101,9 @@ class Agent:
         prompt_template_path: Optional[str] = None,
         target_lang:str = 'English',
         max_steps: int = 10,
-        optimize_tool_call: bool = False
+        optimize_tool_call: bool = False,
+        llm_cache: Optional[LLMCache] = None,
+        history_window_turns: Optional[int] = None
     ):
         """Initializes the Agent.
 
@@ -50,6 +119,8 @@ class Agent:
             target_lang (str): The target language for the agent's responses.
             max_steps (int): The maximum number of steps the agent can take.
             optimize_tool_call (bool): If True, optimizes the tool-calling process by using a custom XML-based prompt mechanism instead of the native API tool-calling feature. This can be useful for models with weaker native tool-calling capabilities.
+            llm_cache (Optional[LLMCache]): If provided, identical LLM requests are answered from this cache instead of calling the API again. Only use it for deterministic steps.
+            history_window_turns (Optional[int]): If provided, only the latest this many turns (an assistant message and the tool results that follow it) are sent to the LLM. The system prompt and the task input are always sent, and the agent's own history is kept in full. If None, the full history is sent. Must be at least 1.
         """
         self.name = name
         self.description = description
@@ -61,6 +132,11 @@ class Agent:
         self.endpoint = endpoint
         self.service_type = service_type # Store service type
         self.max_steps = max_steps
+        self.llm_cache = llm_cache
+        if history_window_turns is not None and history_window_turns < 1:
+            raise ValueError(f"history_window_turns must be None or at least 1, got {history_window_turns}.")
+        self.history_window_turns = history_window_turns
+        self._prompt_template_path = prompt_template_path
 
         self.original_tools: List[Tool] = tools[:]
         
@@ -71,9 +147,10 @@ class Agent:
             if tool.name == 'read_file' and hasattr(tool.func, '__self__') and isinstance(tool.func.__self__, Workspace):
                 bound_func = partial(tool.func, agent=self)
                 
-                # Create a new tool with the agent parameter hidden from the LLM
-                analysis = tool.func.__globals__['analyze_tool_function'](tool.func)
-                new_params = [p for p in analysis['parameters'] if p['name'] != 'agent']
+                # Create a new tool with the agent parameter hidden from the LLM. Passing the
+                # original tool's description and parsed parameters means the new partial
+                # is not analyzed again.
+                new_params = [p for p in tool.parameters if p['name'] != 'agent']
                 
                 agent_specific_tool = Tool(
                     func=bound_func,
@@ -85,16 +162,20 @@ class Agent:
             else:
                 processed_tools.append(tool)
 
-        self.tools: Dict[str, Tool] = {tool.name: tool for tool in processed_tools}
+        # Tools are ordered by name so that the same tool set always yields a byte-identical
+        # system prompt and tool schema, which keeps the provider's prompt cache prefix stable.
+        self.tools: Dict[str, Tool] = {tool.name: tool for tool in sorted(processed_tools, key=lambda t: t.name)}
         
         if "end_task" in self.tools:
-            print("Warning: A user-provided tool named 'end_task' is being overridden by the built-in final answer tool.")
+            logger.warning("A user-provided tool named 'end_task' is being overridden by the built-in final answer tool.")
         # 2. In any case, build in our standard EndTaskTool
-        self.tools["end_task"] = EndTaskTool()
+        self.tools["end_task"] = END_TASK_TOOL
 
         self._api_tools: List[Dict[str, Any]] = [t.info for t in self.tools.values()]
+        self._api_tools_bytes: Optional[bytes] = None # Built on first use by `_tools_cache_bytes`
         
         self.system_prompt: str = self._generate_system_prompt_from_template(prompt_template_path)
+        self._rendered_prompt_key: tuple = self._prompt_key()
         
         self.history: List[Dict[str, Any]] = [{"role": "system", "content": self.system_prompt}]
 
@@ -138,15 +219,55 @@ class Agent:
             tools (List[Tool]): The new list of tools to configure the agent with.
             extra_context (Optional[Dict[str, Any]]): Extra data to pass to the prompt template.
         """
-        self.tools = {tool.name: tool for tool in tools}
-        self.tools["end_task"] = EndTaskTool() # Make sure end_task is always present
-        
-        # Regenerate API tools and system prompt
+        self._set_tools(tools)
+        self._recompile_prompt(extra_context)
+
+    def _set_tools(self, tools: List[Tool]):
+        """Replaces the agent's tool set and the tool schemas sent to the API.
+
+        Args:
+            tools (List[Tool]): The new list of tools. `end_task` is always added.
+        """
+        self.tools = {tool.name: tool for tool in sorted(tools, key=lambda t: t.name)}
+        self.tools["end_task"] = END_TASK_TOOL # Make sure end_task is always present
         self._api_tools = [t.info for t in self.tools.values()]
-        self.system_prompt = self._generate_system_prompt_from_template(
-            getattr(self, '_prompt_template_path', None),
-            extra_context=extra_context
+        self._api_tools_bytes = None
+
+    def _tools_cache_bytes(self) -> bytes:
+        """Returns the tool schemas as one JSON array, for `LLMCache` keys. Built only when a cache is in use."""
+        if self._api_tools_bytes is None:
+            self._api_tools_bytes = b'[' + b','.join([t.info_bytes for t in self.tools.values()]) + b']'
+        return self._api_tools_bytes
+
+    def _prompt_key(self, extra_context: Optional[Dict[str, Any]] = None) -> tuple:
+        """Returns everything the rendered system prompt depends on besides the agent's fixed settings.
+
+        Templates receive the tool objects themselves, so the key covers every field of
+        each tool's metadata. Parameters are compared by their repr, which snapshots them
+        and at worst causes a needless re-render for defaults without a stable repr.
+        """
+        tools_key = tuple(
+            (tool.name, tool.description, tool.is_agent_tool, tool.is_group_tool, repr(tool.parameters))
+            for tool in self.tools.values()
         )
+        return (tools_key, sorted(extra_context.items()) if extra_context else None)
+
+    def _recompile_prompt(self, extra_context: Optional[Dict[str, Any]] = None):
+        """Re-renders the system prompt for the current tools and resets the history.
+
+        Rendering is skipped when the tools and extra context are the same as for
+        the current prompt, e.g. when a Group re-wires an already wired sub-group.
+
+        Args:
+            extra_context (Optional[Dict[str, Any]]): Extra data to pass to the prompt template.
+        """
+        prompt_key = self._prompt_key(extra_context)
+        if prompt_key != self._rendered_prompt_key:
+            self.system_prompt = self._generate_system_prompt_from_template(
+                self._prompt_template_path,
+                extra_context=extra_context
+            )
+            self._rendered_prompt_key = prompt_key
         self.reset() # Reset history to apply new system prompt
 
 
@@ -167,21 +288,10 @@ class Agent:
         
         # If no template path is provided, use a default hard-coded path
         if template_path is None:
-            # Assume the template file is in the prompts/ folder in the same directory as agent.py
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            template_path = os.path.join(current_dir, 'prompts', 'default_agent_prompt.md')
+            template_path = _DEFAULT_PROMPT_TEMPLATE_PATH
         try:
-            # Set up Jinja2 environment to load templates from the file system
-            template_dir = os.path.dirname(template_path)
-            template_filename = os.path.basename(template_path)
-
-            env = jinja2.Environment(
-                loader=jinja2.FileSystemLoader(template_dir),
-                trim_blocks=True, # Automatically remove the first newline after a template tag
-                lstrip_blocks=True # Automatically remove leading spaces before a template tag
-            )
-            
-            template = env.get_template(template_filename)
+            # Reuse the compiled template shared across all agents
+            template = _get_template(os.path.dirname(template_path), os.path.basename(template_path))
         except jinja2.TemplateNotFound:
             raise FileNotFoundError(f"Prompt template not found at: {template_path}")
         
@@ -213,8 +323,7 @@ class Agent:
             # If tool call optimization is enabled, append the tool call prompt
             tool_call_prompt_path = os.path.join(os.path.dirname(template_path), 'tool_call.md')
             try:
-                with open(tool_call_prompt_path, 'r', encoding='utf-8') as f:
-                    tool_call_prompt = f.read()
+                tool_call_prompt = _read_prompt_file(tool_call_prompt_path)
                 return base_prompt + "\n" + tool_call_prompt
             except FileNotFoundError:
                 # Handle case where tool_call.md is not found, maybe log a warning
@@ -281,6 +390,7 @@ class Agent:
         """
         start_time = time.time()
         last_step_time = start_time
+        source = f"Agent:{self.name}" # Built once; used by every event of this run
         
         # Only reset history if it's a new run
         if not resume:
@@ -288,17 +398,17 @@ class Agent:
             # 1. Construct initial input and yield start event
             initial_prompt = (
                 "Task started. Here are your input parameters:\n"
-                + json.dumps(kwargs, indent=2)
+                + json_dumps(kwargs)
                 + "\nNow, begin your work."
             )
             self.history.append({"role": "user", "content": initial_prompt})
             
             payload = copy.deepcopy(kwargs)
             payload["start_time"] = start_time
-            yield Event(f"Agent:{self.name}", "start", payload)
+            yield Event(source, "start", payload)
         else:
             # If resuming, just yield a resume event
-            yield Event(f"Agent:{self.name}", "resume", {"history_length": len(self.history)})
+            yield Event(source, "resume", {"history_length": len(self.history)})
         
         # 2. "Think-Act" loop
         for step in range(self.max_steps):
@@ -312,12 +422,13 @@ class Agent:
                 step_payload["last_step_elapsed_time"] = current_time - last_step_time
             last_step_time = current_time
             
-            yield Event(f"Agent:{self.name}", "step", step_payload)
+            yield Event(source, "step", step_payload)
 
             # 3. Think: Call LLM
+            messages = self._windowed_history()
             llm_params = {
                 "model": self.model_id,
-                "messages": self.history,
+                "messages": messages,
                 "stream": True
             }
             if not self.optimize_tool_call:
@@ -326,21 +437,35 @@ class Agent:
             
             # Use the service to get the completion stream
             response_stream = self.service.completion(**llm_params)
+            if self.llm_cache is not None:
+                cache_key = self.llm_cache.make_key(
+                    self.model_id,
+                    messages,
+                    None if self.optimize_tool_call else self._tools_cache_bytes()
+                )
+                response_stream = self.llm_cache.wrap(cache_key, response_stream)
 
             # 4. Reassemble response from the stream using standardized Response objects
             full_response_content = ""
             full_reasoning_content = ""
-            tool_calls_in_progress = [] # Accumulate tool calls across responses
+            # Streamed tool-call fragments keyed by their index: chunks of parallel calls may
+            # interleave, and the parts are joined once at the end instead of concatenated per chunk.
+            tool_call_parts: Dict[int, Dict[str, List[str]]] = {}
+            completed_tool_calls = [] # Tool calls that arrive whole (e.g. parsed from XML)
+            # Streams the final answer of an end_task call as content while its arguments arrive
+            final_answer_parsers: Dict[int, IncrementalJsonFieldParser] = {}
 
             # Iterate over the standardized Response objects from the service
             for response_obj in response_stream:
-                if response_obj.thinking:
-                    full_reasoning_content += response_obj.thinking
-                    yield Event(f"Agent:{self.name}", "reasoning_stream", {"content": response_obj.thinking})
-
-                if response_obj.content:
-                    full_response_content += response_obj.content
-                    yield Event(f"Agent:{self.name}", "content_stream", {"content": response_obj.content})
+                thinking = response_obj.thinking
+                if thinking:
+                    full_reasoning_content += thinking
+                    yield Event(source, "reasoning_stream", {"content": thinking})
+
+                content = response_obj.content
+                if content:
+                    full_response_content += content
+                    yield Event(source, "content_stream", {"content": content})
                 
                 if response_obj.tool_calls:
                     for tc_info in response_obj.tool_calls:
@@ -348,39 +473,93 @@ class Agent:
                             tool_call_chunk = tc_info["delta"]
                             index = tc_info["index"]
                             
-                            if index >= len(tool_calls_in_progress):
-                                tool_calls_in_progress.append({"id": f"call_{index}", "type": "function", "function": {"name": "", "arguments": ""}})
+                            parts = tool_call_parts.get(index)
+                            if parts is None:
+                                parts = tool_call_parts[index] = {"name": [], "arguments": []}
                             
-                            func = tool_calls_in_progress[index]['function']
                             if tool_call_chunk.get('name'):
-                                func['name'] += tool_call_chunk['name']
+                                parts['name'].append(tool_call_chunk['name'])
                             if tool_call_chunk.get('arguments'):
-                                func['arguments'] += tool_call_chunk['arguments']
+                                parts['arguments'].append(tool_call_chunk['arguments'])
                             
-                            yield Event(f"Agent:{self.name}", "tool_call_stream", {"index": index, "delta": tool_call_chunk})
+                            yield Event(source, "tool_call_stream", {"index": index, "delta": tool_call_chunk})
+
+                            if tool_call_chunk.get('arguments'):
+                                answer_parser = final_answer_parsers.get(index)
+                                if answer_parser is None and "".join(parts['name']) == "end_task":
+                                    answer_parser = final_answer_parsers[index] = IncrementalJsonFieldParser("final_answer")
+                                    # Catch up on argument chunks that arrived with the name
+                                    answer_chunk = answer_parser.feed("".join(parts['arguments']))
+                                elif answer_parser is not None:
+                                    answer_chunk = answer_parser.feed(tool_call_chunk['arguments'])
+                                else:
+                                    answer_chunk = ""
+                                if answer_chunk:
+                                    yield Event(source, "content_stream", {"content": answer_chunk})
                         else: # This is a complete tool call (from the final Response object)
-                            tool_calls_in_progress.append(tc_info)
+                            completed_tool_calls.append(tc_info)
+
+            tool_calls_in_progress = [
+                {
+                    "id": f"call_{index}",
+                    "type": "function",
+                    "function": {"name": "".join(parts['name']), "arguments": "".join(parts['arguments'])}
+                }
+                for index, parts in sorted(tool_call_parts.items())
+            ]
+            tool_calls_in_progress.extend(completed_tool_calls)
 
             # Assemble the complete message to add to history
             assembled_message = {"role": "assistant"}
             if full_response_content:
                 assembled_message["content"] = full_response_content
             
+            # Prioritize 'end_task': if it's present with valid arguments, finish right away
+            # without parsing or running the other tool calls of this step.
+            for i, tc in enumerate(tool_calls_in_progress):
+                func = tc.get('function', {})
+                if func.get('name') != 'end_task' or not func.get('arguments'):
+                    continue
+                try:
+                    task_result = json.loads(func['arguments'])
+                except json.JSONDecodeError:
+                    continue # Fall back to the regular path, which skips invalid calls
+
+                assembled_message["tool_calls"] = [{
+                    "id": tc.get("id", f"call_{i}"),
+                    "type": "function",
+                    "function": func
+                }]
+                if not self.optimize_tool_call:
+                    assembled_message["content"] = None
+                self.history.append(assembled_message)
+
+                current_time = time.time()
+                task_result["current_time"] = current_time
+                task_result["total_elapsed_time"] = current_time - start_time
+                task_result["total_steps"] = step + 1
+
+                yield Event(source, "end", task_result)
+                return
+
             # Filter and validate tool calls for history
             valid_tool_calls = []
+            tool_call_args: Dict[str, Any] = {} # Parsed arguments by call id, so each call is decoded once
             for i, tc in enumerate(tool_calls_in_progress):
                 func = tc.get('function', {})
                 if func.get('name') and func.get('arguments'):
                     try:
                         # Validate JSON arguments
-                        json.loads(func['arguments'])
-                        valid_tool_calls.append({
-                            "id": tc.get("id", f"call_{i}"),
-                            "type": "function",
-                            "function": func
-                        })
+                        args = json.loads(func['arguments'])
                     except json.JSONDecodeError:
                         continue # Skip invalid tool calls
+                    call_id = tc.get("id", f"call_{i}")
+                    tool_call_args[call_id] = args
+                    valid_tool_calls.append({
+                        "id": call_id,
+                        "type": "function",
+                        "function": func
+                    })
             
             if valid_tool_calls:
                 assembled_message["tool_calls"] = valid_tool_calls
@@ -393,19 +572,6 @@ class Agent:
             if "tool_calls" in assembled_message:
                 tool_calls = assembled_message["tool_calls"]
 
-                # Prioritize 'end_task': if it's present, run it exclusively.
-                end_task_call = next((tc for tc in tool_calls if tc['function']['name'] == 'end_task'), None)
-                if end_task_call:
-                    task_result = json.loads(end_task_call['function']['arguments'])
-                    
-                    current_time = time.time()
-                    task_result["current_time"] = current_time
-                    task_result["total_elapsed_time"] = current_time - start_time
-                    task_result["total_steps"] = step + 1
-                    
-                    yield Event(f"Agent:{self.name}", "end", task_result)
-                    return
-
                 # If there's only one tool call, execute it sequentially.
                 if len(tool_calls) == 1:
                     tool_call_data = tool_calls[0]
@@ -414,13 +580,13 @@ class Agent:
                     tool_start_time = time.time()
                     try:
                         tool_name = tool_call_data['function']['name']
-                        tool_args = json.loads(tool_call_data['function']['arguments'])
-                        yield Event(f"Agent:{self.name}", "decision", {"tool_name": tool_name, "tool_args": tool_args})
+                        tool_args = tool_call_args[tool_call_data['id']]
+                        yield Event(source, "decision", {"tool_name": tool_name, "tool_args": tool_args})
 
                         tool_to_run = self.tools.get(tool_name)
                         is_group = getattr(tool_to_run, 'is_group_tool', False)
                         
-                        execution_generator = self._execute_tool_from_dict(tool_call_data)
+                        execution_generator = self._execute_tool_from_dict(tool_call_data, tool_args)
                         
                         if isinstance(execution_generator, Iterator):
                             for sub_event in execution_generator:
@@ -447,7 +613,7 @@ class Agent:
                         "current_time": current_time,
                         "elapsed_time": current_time - tool_start_time
                     }
-                    yield Event(f"Agent:{self.name}", "tool_result", tool_result_payload)
+                    yield Event(source, "tool_result", tool_result_payload)
                     
                     self.history.append({
                         "role": "tool",
@@ -465,13 +631,13 @@ class Agent:
                         final_output = ""
                         try:
                             tool_name = tool_call_data['function']['name']
-                            tool_args = json.loads(tool_call_data['function']['arguments'])
-                            broker.emit(f"Agent:{self.name}", "decision", {"tool_name": tool_name, "tool_args": tool_args})
+                            tool_args = tool_call_args[tool_call_data['id']]
+                            broker.emit(source, "decision", {"tool_name": tool_name, "tool_args": tool_args})
 
                             tool_to_run = self.tools.get(tool_name)
                             is_group = getattr(tool_to_run, 'is_group_tool', False)
                             
-                            execution_generator = self._execute_tool_from_dict(tool_call_data)
+                            execution_generator = self._execute_tool_from_dict(tool_call_data, tool_args)
                             
                             if isinstance(execution_generator, Iterator):
                                 for sub_event in execution_generator:
@@ -493,7 +659,7 @@ class Agent:
 
                         current_time = time.time()
                         # Emit a special event to signal completion and carry the final result
-                        broker.emit(f"Agent:{self.name}", "tool_completed", {
+                        broker.emit(source, "tool_completed", {
                             "tool_call_id": tool_call_data['id'],
                             "tool_name": tool_name,
                             "output": final_output,
@@ -501,7 +667,9 @@ class Agent:
                             "elapsed_time": current_time - tool_start_time
                         })
 
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
+                    # One worker per call so every tool starts immediately: the step takes
+                    # as long as the slowest tool rather than queuing behind the default pool size.
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=len(tool_calls)) as executor:
                         for tool_call in tool_calls:
                             executor.submit(tool_worker, tool_call, event_broker)
                         
@@ -519,7 +687,7 @@ class Agent:
                                     "elapsed_time": event.payload['elapsed_time']
                                 }
                                 # Yield the final tool_result event for this tool
-                                yield Event(f"Agent:{self.name}", "tool_result", tool_result_payload)
+                                yield Event(source, "tool_result", tool_result_payload)
                             else:
                                 yield event # Forward sub-agent events in real-time
                     
@@ -535,7 +703,7 @@ class Agent:
 
                 continue
             else: # If the LLM replies directly without calling a tool
-                yield Event(f"Agent:{self.name}", "thinking", {"content": full_response_content})
+                yield Event(source, "thinking", {"content": full_response_content})
                 # If the model responds directly, prompt it to use end_task to formalize the completion.
                 self.history.append({
                     "role": "user",
@@ -544,7 +712,7 @@ class Agent:
                 continue
         # If the loop finishes without completion
         final_message = f"Error: Agent '{self.name}' failed to complete the task within {self.max_steps} steps."
-        yield Event(f"Agent:{self.name}", "error", {"message": final_message})
+        yield Event(source, "error", {"message": final_message})
         
         current_time = time.time()
         end_payload = {
@@ -553,21 +721,24 @@ class Agent:
             "total_elapsed_time": current_time - start_time,
             "total_steps": self.max_steps
         }
-        yield Event(f"Agent:{self.name}", "end", end_payload)
+        yield Event(source, "end", end_payload)
         return
     
-    def _execute_tool_from_dict(self, tool_call_dict: Dict) -> Any:
+    def _execute_tool_from_dict(self, tool_call_dict: Dict, args: Optional[Dict[str, Any]] = None) -> Any:
         """Executes a tool. If the tool is an Agent, returns its event generator.
 
         Args:
             tool_call_dict (Dict): The tool call dictionary.
+            args (Optional[Dict[str, Any]]): The already parsed arguments. If None,
+                they are parsed from the tool call dictionary.
 
         Returns:
             Any: The result of the tool execution. This can be a direct result
                  or an iterator of events if the tool is another agent.
         """
         name = tool_call_dict['function']['name']
-        args = json.loads(tool_call_dict['function']['arguments'])
+        if args is None:
+            args = json.loads(tool_call_dict['function']['arguments'])
         tool: Optional[Tool] = self.tools.get(name)
 
         if not tool:
@@ -586,26 +757,48 @@ class Agent:
     def as_tool(self) -> Tool:
         """Wraps the entire Agent instance into a Tool.
 
-        This allows the agent to be called by other agents.
+        This allows the agent to be called by other agents. Each call runs on a
+        separate instance built from the original configuration; instances are
+        reused once a previous call has finished, and concurrent calls never share one.
 
         Returns:
             Tool: A Tool instance that encapsulates this agent.
         """
+        # Instances that finished a previous call. An instance is only ever driven by one
+        # caller at a time, so concurrent calls stay isolated while sequential calls reuse
+        # an instance (run() resets its history) instead of constructing a new Agent.
+        idle_instances: List['Agent'] = []
+
+        def release_after(agent_instance: 'Agent', event_stream: Iterator[Event]) -> Iterator[Event]:
+            try:
+                yield from event_stream
+            finally:
+                idle_instances.append(agent_instance)
+
         # Dynamically create a wrapper function
         def agent_runner(stream: bool = False, **kwargs):
-            # On each call, create a new Agent instance to ensure state isolation
-            agent_instance = Agent(
-                name=self.name,
-                description=self.description,
-                input_parameters=self.input_parameters,
-                tools=self.original_tools, # Ensure isolation
-                endpoint=self.endpoint,
-                service_type=self.service_type, # Pass the service type
-                model_id=self.model_id,
-                max_steps=self.max_steps,
-                optimize_tool_call=self.optimize_tool_call
-            )
-            return agent_instance.run(stream=stream, **kwargs)
+            try:
+                agent_instance = idle_instances.pop()
+            except IndexError:
+                agent_instance = Agent(
+                    name=self.name,
+                    description=self.description,
+                    input_parameters=self.input_parameters,
+                    tools=self.original_tools, # Ensure isolation
+                    endpoint=self.endpoint,
+                    service_type=self.service_type, # Pass the service type
+                    model_id=self.model_id,
+                    max_steps=self.max_steps,
+                    optimize_tool_call=self.optimize_tool_call,
+                    llm_cache=self.llm_cache,
+                    history_window_turns=self.history_window_turns
+                )
+            if stream:
+                return release_after(agent_instance, agent_instance.run(stream=True, **kwargs))
+            try:
+                return agent_instance.run(stream=False, **kwargs)
+            finally:
+                idle_instances.append(agent_instance)
 
         # Fake a function so the Tool class can parse it
         # This step is a bit hacky, but very effective
@@ -637,9 +830,28 @@ class Agent:
         """Resets the agent's history.
 
         This clears the conversation history, preparing the agent for a new run.
+        The system prompt is kept byte-for-byte, so consecutive runs share the
+        same request prefix and benefit from the provider's prompt caching.
         """
         self.history = [{"role": "system", "content": self.system_prompt}]
 
+    def _windowed_history(self) -> List[Dict[str, Any]]:
+        """Returns the messages to send to the LLM, limited to `history_window_turns`.
+
+        A turn starts at an assistant message and includes the tool results and
+        notes that follow it, so a tool call is never separated from its result.
+        Everything before the first assistant message (the system prompt, the
+        task input and any loaded files) is always included. `self.history`
+        itself is left untouched.
+        """
+        if self.history_window_turns is None:
+            return self.history
+        turn_starts = [i for i, message in enumerate(self.history) if message.get("role") == "assistant"]
+        excess = len(turn_starts) - self.history_window_turns
+        if excess <= 0:
+            return self.history
+        return self.history[:turn_starts[0]] + self.history[turn_starts[excess]:]
+
     def copy(self) -> 'Agent':
         """Creates a deep copy of the agent instance."""
         return Agent(
@@ -653,7 +865,9 @@ class Agent:
             prompt_template_path=getattr(self, '_prompt_template_path', None),
             target_lang=self.target_lang,
             max_steps=self.max_steps,
-            optimize_tool_call=self.optimize_tool_call
+            optimize_tool_call=self.optimize_tool_call,
+            llm_cache=self.llm_cache,
+            history_window_turns=self.history_window_turns
         )
 
     def __mul__(self, other: int) -> List['Agent']:
@@ -673,5 +887,6 @@ class Agent:
             "target_lang": self.target_lang,
             "max_steps": self.max_steps,
             "optimize_tool_call": self.optimize_tool_call,
+            "history_window_turns": self.history_window_turns,
             "endpoint": self.endpoint.name if self.endpoint else None
         }
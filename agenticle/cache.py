@@ -0,0 +1,113 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing      import Any, Dict, Iterator, List, Optional, Union
+
+from .schema import Response
+
+
+class LLMCache:
+    """An in-memory LRU cache of language model responses.
+
+    Requests are keyed on the model, the full message list and the tool
+    schemas. On a hit the recorded stream of `Response` objects is replayed,
+    so the agent sees exactly the same chunks as on the original call without
+    contacting the API. Only streams that were consumed to the end are stored.
+
+    Caching only makes sense for deterministic steps: pass an instance to an
+    Agent via `llm_cache` to opt in. A single cache may be shared by several
+    agents and is safe to use from multiple threads.
+
+    Attributes:
+        max_size (int): The maximum number of responses kept in memory.
+    """
+    def __init__(self, max_size: int = 256):
+        """Initializes the LLMCache.
+
+        Args:
+            max_size (int): The maximum number of responses kept in memory.
+                The least recently used entry is evicted when it is exceeded.
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, List[Response]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        tools: Optional[Union[List[Dict[str, Any]], bytes]] = None
+    ) -> str:
+        """Builds the cache key of a completion request.
+
+        Args:
+            model (str): The model ID.
+            messages (List[Dict[str, Any]]): The messages sent to the model.
+            tools (Optional[Union[List[Dict[str, Any]], bytes]]): The tool schemas sent to the model,
+                or their pre-serialized JSON (see `Tool.info_bytes`), which is hashed as-is.
+
+        Returns:
+            str: A hex digest identifying the request.
+        """
+        payload = json.dumps(
+            {"model": model, "messages": messages},
+            sort_keys=True,
+            default=str
+        )
+        digest = hashlib.sha256(payload.encode('utf-8'))
+        digest.update(b'\x00') # Separates the tool schemas from the messages
+        if isinstance(tools, bytes):
+            digest.update(tools)
+        else:
+            digest.update(json.dumps(tools, sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Response]]:
+        """Returns the recorded responses for a key, or None on a miss."""
+        with self._lock:
+            responses = self._entries.get(key)
+            if responses is not None:
+                self._entries.move_to_end(key)
+            return responses
+
+    def set(self, key: str, responses: List[Response]):
+        """Stores the recorded responses for a key, evicting the oldest entry if needed."""
+        with self._lock:
+            self._entries[key] = responses
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def wrap(self, key: str, response_stream: Iterator[Response]) -> Iterator[Response]:
+        """Replays a cached response stream, or records a live one into the cache.
+
+        Args:
+            key (str): The cache key of the request, see `make_key`.
+            response_stream (Iterator[Response]): The lazy stream from the service.
+                It is not started on a cache hit.
+
+        Yields:
+            Response: The standardized response chunks.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            yield from cached
+            return
+
+        recorded: List[Response] = []
+        for response in response_stream:
+            recorded.append(response)
+            yield response
+        self.set(key, recorded)
+
+    def clear(self):
+        """Removes all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"LLMCache(size={len(self._entries)}, max_size={self.max_size})"
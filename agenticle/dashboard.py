@@ -3,11 +3,14 @@ from fastapi import FastAPI
 from fastapi.responses import HTMLResponse, StreamingResponse
 from pathlib import Path
 import asyncio
-import json
+import logging
 
 from .agent import Agent
 from .event import Event
 from .group import Group
+from .utils import json_dumps
+
+logger = logging.getLogger(__name__)
 
 class Dashboard:
     """
@@ -34,13 +37,13 @@ class Dashboard:
                 event_stream = self.agent_or_group.run(stream=True, **self.kwargs)
                 try:
                     for event in event_stream:
-                        yield f"data: {json.dumps(event.__dict__)}\n\n"
+                        yield f"data: {json_dumps(event.to_dict())}\n\n"
                         await asyncio.sleep(0.1)  # Small delay to prevent overwhelming the client
                     # After the stream is finished, send a special event to the client
                     end_event = Event(source="Dashboard", type="session_end", payload={})
-                    yield f"data: {json.dumps(end_event.__dict__)}\n\n"
+                    yield f"data: {json_dumps(end_event.to_dict())}\n\n"
                 except asyncio.CancelledError:
-                    print("Client disconnected.")
+                    logger.info("Client disconnected.")
 
             return StreamingResponse(event_generator(), media_type="text/event-stream")
 
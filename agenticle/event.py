@@ -3,6 +3,9 @@ from typing import Dict, Any, Optional
 
 class Event:
     """Defines a standard event structure."""
+    # Events are created for every streamed chunk, so avoid a per-instance __dict__
+    __slots__ = ("source", "type", "payload")
+
     def __init__(self, source: str, type: str, payload: Optional[Dict[str, Any]] = None):
         """Initializes an Event.
 
@@ -15,15 +18,24 @@ class Event:
         self.type = type
         self.payload = payload or {}
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the event as a plain dictionary, e.g. for JSON serialization."""
+        return {"source": self.source, "type": self.type, "payload": self.payload}
+
     def __repr__(self):
         """Provides a string representation of the Event instance."""
         return f"Event(source={self.source}, type={self.type}, payload={self.payload})"
 
 class EventBroker:
-    """A simple event broker that uses a queue to decouple event producers and consumers."""
+    """A simple event broker that uses a queue to decouple event producers and consumers.
+
+    Producers are worker threads and the consumer blocks on `queue.get()`, so the
+    queue must be thread-safe. `queue.SimpleQueue` is used as it is implemented in C
+    and skips the task tracking and size bookkeeping of `queue.Queue`.
+    """
     def __init__(self):
         """Initializes the EventBroker."""
-        self.queue = queue.Queue()
+        self.queue = queue.SimpleQueue()
 
     def emit(self, source: str, type: str, payload: Optional[Dict[str, Any]] = None):
         """Creates an event and puts it into the queue.
@@ -7,10 +7,14 @@ from .tool   import Tool, Workspace
 from .event  import Event, EventBroker
 from .schema import Vote
 from .optimizer import BaseOptimizer, CompetitionOptimizer
+from .utils  import json_loads
 
 import concurrent.futures
+import logging
 import json
 
+logger = logging.getLogger(__name__)
+
 class Group:
     """
     A team of Agents that can collaborate to accomplish complex tasks.
@@ -76,7 +80,7 @@ class Group:
             self.shared_tools.extend(self.workspace.get_tools())
 
         if mode == 'round_robin' and manager_agent_name:
-            print("Warning: 'manager_agent_name' is ignored in 'round_robin' mode.")
+            logger.warning("'manager_agent_name' is ignored in 'round_robin' mode.")
 
         if manager_agent_name:
             if manager_agent_name not in self.agents:
@@ -105,9 +109,9 @@ class Group:
                     # Create a new function with the 'agent' argument pre-filled
                     bound_func = partial(tool.func, agent=agent)
                     
-                    # Create a new Tool instance for this agent, excluding the 'agent' parameter from the LLM's view
-                    analysis = tool.func.__globals__['analyze_tool_function'](tool.func)
-                    new_params = [p for p in analysis['parameters'] if p['name'] != 'agent']
+                    # Create a new Tool instance for this agent, excluding the 'agent' parameter from the LLM's view.
+                    # Passing the shared tool's description and parsed parameters means the new partial is not analyzed again.
+                    new_params = [p for p in tool.parameters if p['name'] != 'agent']
                     
                     agent_specific_tool = Tool(
                         func=bound_func,
@@ -387,7 +391,7 @@ class Group:
 
                 if final_answer:
                     try:
-                        result_json = json.loads(final_answer)
+                        result_json = json_loads(final_answer)
                         if "vote" in result_json and "reason" in result_json:
                             vote_data = {
                                 "agent_name": agent.name,
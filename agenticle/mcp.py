@@ -3,11 +3,14 @@ from urllib.parse import urlparse
 from typing       import Dict, Any
 from .tool        import Tool
 import threading
+import logging
 import requests
 import queue
 import json
 import subprocess
 
+logger = logging.getLogger(__name__)
+
 class StdioClient:
     """A client for communicating with a subprocess via standard I/O."""
     def __init__(self, command:str) -> None:
@@ -128,7 +131,7 @@ class LegacyClient:
                 if msg_id in self.response_queues:
                     self.response_queues[msg_id].put(data)
                 else:
-                    print(f"Unmatched response (id={msg_id})")
+                    logger.debug("Unmatched response (id=%s)", msg_id)
     
     def _stdio_recv(self):
         if not self._running: return
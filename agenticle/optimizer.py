@@ -3,7 +3,16 @@ from .schema import Endpoint
 from .tool   import Tool
 from .utils  import model_id
 import os
-from typing import List
+import threading
+from typing import Dict, List
+
+# Prompt templates shipped with the package, resolved once at import.
+# Agent caches the compiled template per path, so every optimizer shares it.
+_PROMPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'prompts')
+_COMPETITION_TEMPLATE_PATH = os.path.join(_PROMPTS_DIR, 'competition_opt_prompt.md')
+_PROMPT_OPT_TEMPLATE_PATH = os.path.join(_PROMPTS_DIR, 'opt_prompt.md')
+_BRAINSTORM_TEMPLATE_PATH = os.path.join(_PROMPTS_DIR, 'brainstorm_prompt.md')
+_FORMAT_TEMPLATE_PATH = os.path.join(_PROMPTS_DIR, 'format_prompt.md')
 
 class BaseOptimizer:
     """Base class for all optimizers."""
@@ -11,11 +20,36 @@ class BaseOptimizer:
         self.endpoint = endpoint
         self.model_id = model_id
         self.agent: Agent = None
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        # Instances that finished a previous call, by template name. An instance is only
+        # ever run by one caller at a time, so concurrent optimize() calls stay isolated
+        # while sequential calls reuse an instance (run() resets its history).
+        self._idle_agents: Dict[str, List[Agent]] = {}
 
     def init(self, **kwargs):
-        """Initializes the internal agent of the optimizer."""
+        """Initializes the template agent(s) of the optimizer."""
         raise NotImplementedError
 
+    def _ensure_init(self):
+        """Calls `init()` on first use only; safe when several threads share the optimizer."""
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self.init()
+                    self._initialized = True
+
+    def _acquire(self, template: Agent) -> Agent:
+        """Returns an instance of `template` for the caller's sole use, reusing an idle one if possible."""
+        try:
+            return self._idle_agents.setdefault(template.name, []).pop()
+        except IndexError:
+            return template.copy()
+
+    def _release(self, template: Agent, agent: Agent):
+        """Returns an instance obtained from `_acquire` once its run has finished."""
+        self._idle_agents[template.name].append(agent)
+
     def optimize(self, *args, **kwargs) -> str:
         """Runs the optimization process."""
         raise NotImplementedError
@@ -26,8 +60,7 @@ class CompetitionOptimizer(BaseOptimizer):
     """
     def __init__(self, endpoint: Endpoint = Endpoint(), model_id: str = model_id):
         super().__init__(endpoint, model_id)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.template_path = os.path.join(current_dir, 'prompts', 'competition_opt_prompt.md')
+        self.template_path = _COMPETITION_TEMPLATE_PATH
 
     def init(self):
         """Initializes the competition optimizer agent."""
@@ -55,25 +88,27 @@ class CompetitionOptimizer(BaseOptimizer):
         Returns:
             str: The selected best result.
         """
-        self.init()
+        self._ensure_init()
         
         # The results are formatted as a numbered list for the prompt.
-        formatted_results = "\n".join(f"{i+1}. {result}" for i, result in enumerate(results))
+        formatted_results = "\n".join([f"{i}. {result}" for i, result in enumerate(results, 1)])
         
-        return self.agent.run(
-            stream=False, 
-            task_description=task_description, 
-            results=formatted_results
-        )
+        agent = self._acquire(self.agent)
+        try:
+            return agent.run(
+                stream=False, 
+                task_description=task_description, 
+                results=formatted_results
+            )
+        finally:
+            self._release(self.agent, agent)
 
 class PromptOptimizer(BaseOptimizer):
     def __init__(self, endpoint: Endpoint = Endpoint(), model_id: str = model_id, enable_template_format: bool = False, target_lang: str = "the user's language"):
         super().__init__(endpoint, model_id)
         self.enable_template_format = enable_template_format
         self.target_lang = target_lang
-        
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.template_path = os.path.join(current_dir, 'prompts', 'opt_prompt.md')
+        self.template_path = _PROMPT_OPT_TEMPLATE_PATH
 
     def init(self):
         target_lang = f"a Jinja2 template format in {self.target_lang}" if self.enable_template_format else self.target_lang
@@ -91,8 +126,12 @@ class PromptOptimizer(BaseOptimizer):
         )
 
     def optimize(self, prompt: str) -> str:
-        self.init()
-        return self.agent.run(stream=False, prompt=prompt)
+        self._ensure_init()
+        agent = self._acquire(self.agent)
+        try:
+            return agent.run(stream=False, prompt=prompt)
+        finally:
+            self._release(self.agent, agent)
 
 class NaturalLanguageOptimizer(BaseOptimizer):
     """
@@ -101,15 +140,14 @@ class NaturalLanguageOptimizer(BaseOptimizer):
     """
     def __init__(self, endpoint: Endpoint = Endpoint(), model_id: str = model_id):
         super().__init__(endpoint, model_id)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.brainstorm_template_path = os.path.join(current_dir, 'prompts', 'brainstorm_prompt.md')
-        self.format_template_path = os.path.join(current_dir, 'prompts', 'format_prompt.md')
+        self.brainstorm_template_path = _BRAINSTORM_TEMPLATE_PATH
+        self.format_template_path = _FORMAT_TEMPLATE_PATH
         
         self.brainstorm_agent: Agent = None
         self.format_agent: Agent = None
 
-    def init(self, tools: List[Tool] = []):
-        """Initializes the internal agents."""
+    def init(self):
+        """Initializes the template agents; each `optimize()` call runs its own instances of them."""
         self.brainstorm_agent = Agent(
             name="BrainstormingAgent",
             description="A creative expert in designing AI agent teams.",
@@ -134,35 +172,42 @@ class NaturalLanguageOptimizer(BaseOptimizer):
             model_id=self.model_id,
             prompt_template_path=self.format_template_path,
         )
-        
-        available_tools_str = "\n".join(
-            f'- `{tool.name}`: {tool.description}' for tool in tools
-        ) if tools else "No external tools provided."
-
-        self.brainstorm_agent._configure_with_tools(
-            tools=[],
-            extra_context={"available_tools": available_tools_str}
-        )
 
     def optimize(self, requirement: str, tools: List[Tool] = [], group: bool = False) -> str:
         """
         Generates a full, well-formatted YAML configuration from a brief requirement.
         """
-        self.init(tools=tools)
+        self._ensure_init()
         entity_type = "Group" if group else "Agent"
 
+        available_tools_str = "\n".join(
+            f'- `{tool.name}`: {tool.description}' for tool in tools
+        ) if tools else "No external tools provided."
+
         # Step 1: Brainstorm the configuration
-        brainstorming_plan = self.brainstorm_agent.run(
-            stream=False,
-            requirement=requirement,
-            entity_type=entity_type
-        )
+        brainstorm_agent = self._acquire(self.brainstorm_agent)
+        try:
+            brainstorm_agent._configure_with_tools(
+                tools=[],
+                extra_context={"available_tools": available_tools_str}
+            )
+            brainstorming_plan = brainstorm_agent.run(
+                stream=False,
+                requirement=requirement,
+                entity_type=entity_type
+            )
+        finally:
+            self._release(self.brainstorm_agent, brainstorm_agent)
 
         # Step 2: Format the brainstormed plan into YAML
-        raw_yaml = self.format_agent.run(
-            stream=False,
-            brainstorming_plan=brainstorming_plan
-        )
+        format_agent = self._acquire(self.format_agent)
+        try:
+            raw_yaml = format_agent.run(
+                stream=False,
+                brainstorming_plan=brainstorming_plan
+            )
+        finally:
+            self._release(self.format_agent, format_agent)
         
         # Clean the output by removing markdown fences
         return raw_yaml.strip().replace("```yaml", "").replace("```", "").strip()
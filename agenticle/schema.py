@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field, asdict
-from typing      import Optional
+from typing      import Optional, Sequence, Dict, Any
 from .utils      import api_key, base_url
 
 _base_url = {
@@ -10,7 +10,7 @@ _platform_map = {
     'openai_compat': ['openai', 'deepseek'],
 }
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Endpoint:
     """
     Stores API endpoint and credential information.
@@ -42,7 +42,7 @@ class Endpoint:
     def to_dict(self):
         return asdict(self)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Vote:
     """
     Stores a vote for a group.
@@ -56,10 +56,16 @@ class Vote:
     vote: str
     reason: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Response:
+    """
+    A standardized chunk of a streamed language model response.
+
+    One instance is created per streamed chunk, so the class is slotted and
+    `tool_calls` defaults to a shared empty tuple instead of a new list.
+    """
     success: bool = True
     thinking: str = ""
     content: str = ""
-    tool_calls: list = field(default_factory=list)
+    tool_calls: Sequence[Dict[str, Any]] = ()
     error: Optional[str] = None
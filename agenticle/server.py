@@ -1,15 +1,18 @@
 import asyncio
 import uuid
+import logging
 from typing import Dict, Any, Union
 
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uvicorn
-import json
 
 from .agent import Agent
 from .group import Group
+from .utils import json_dumps
+
+logger = logging.getLogger(__name__)
 
 # --- Globals ---
 app = FastAPI(
@@ -80,10 +83,10 @@ async def run_task_stream(request: TaskRunRequest):
         event_stream = agent_or_group.run(stream=True, **request.input_data)
         try:
             for event in event_stream:
-                yield f"data: {json.dumps(event.__dict__)}\n\n"
+                yield f"data: {json_dumps(event.to_dict())}\n\n"
                 await asyncio.sleep(0.01) # Yield control to the event loop
         except asyncio.CancelledError:
-            print("Client disconnected from stream.")
+            logger.info("Client disconnected from stream.")
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
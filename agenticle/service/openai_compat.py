@@ -1,33 +1,28 @@
-import os
+import functools
 from openai import OpenAI
 from typing import List, Dict, Any, Iterator
 
 from agenticle.schema import Endpoint, Response
 
+
+@functools.lru_cache(maxsize=None)
+def _get_client(api_key: str, base_url: str) -> OpenAI:
+    """Returns the process-wide client for a set of credentials.
+
+    Sharing one client lets every agent using the same endpoint reuse its HTTP
+    connection pool instead of opening new connections (and TLS handshakes).
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
 class OpenAICompatService:
     def __init__(self, endpoint: Endpoint):
         self.endpoint = endpoint
         self._client: OpenAI = None
-        self._init_client()
 
     def _init_client(self):
-        """Initializes the OpenAI client with the provided API key and base URL."""
-        # Temporarily store the original API key if it exists in environment
-        prev_api_key = os.environ.get('OPENAI_API_KEY')
-        
-        # Set the API key from the endpoint for client initialization
-        os.environ['OPENAI_API_KEY'] = self.endpoint.api_key
-        
-        # Initialize the OpenAI client
-        self._client = OpenAI(api_key=self.endpoint.api_key, base_url=self.endpoint.base_url)
-        
-        # Restore the original API key if it was set
-        if prev_api_key is not None:
-            os.environ['OPENAI_API_KEY'] = prev_api_key
-        else:
-            # If it wasn't set, remove it to clean up
-            if 'OPENAI_API_KEY' in os.environ:
-                del os.environ['OPENAI_API_KEY']
+        """Attaches the shared OpenAI client for the endpoint's API key and base URL."""
+        self._client = _get_client(self.endpoint.api_key, self.endpoint.base_url)
 
     def completion(self, model: str, messages: List[Dict[str, Any]], stream: bool, **kwargs) -> Iterator[Response]:
         """
@@ -40,6 +35,10 @@ class OpenAICompatService:
             **kwargs
         }
         
+        # The client is created lazily, so constructing agents never touches the network stack
+        if self._client is None:
+            self._init_client()
+        
         response_stream = self._client.chat.completions.create(**llm_params)
         
         for chunk in response_stream:
@@ -48,13 +47,19 @@ class OpenAICompatService:
             except (AttributeError, IndexError):
                 continue
             
-            if hasattr(delta, 'reasoning_content') and delta.reasoning_content:
-                yield Response(thinking=delta.reasoning_content)
+            # Not every provider sends reasoning_content, so look it up once with a default
+            reasoning_content = getattr(delta, 'reasoning_content', None)
+            if reasoning_content:
+                yield Response(thinking=reasoning_content)
 
-            if delta.content:
-                yield Response(content=delta.content)
+            content = delta.content
+            if content:
+                yield Response(content=content)
             
-            if delta.tool_calls:
-                for tool_call_chunk in delta.tool_calls:
-                    # Yield partial tool call information directly
-                    yield Response(tool_calls=[{"index": tool_call_chunk.index, "delta": tool_call_chunk.function.dict()}])
+            tool_calls = delta.tool_calls
+            if tool_calls:
+                for tool_call_chunk in tool_calls:
+                    # Yield partial tool call information directly; a plain dict avoids a pydantic dump per chunk
+                    function = tool_call_chunk.function
+                    tool_call_delta = {"name": function.name, "arguments": function.arguments} if function else {}
+                    yield Response(tool_calls=[{"index": tool_call_chunk.index, "delta": tool_call_delta}])
@@ -1,5 +1,60 @@
-from typing import Callable, Any, Dict, Optional, List
-from .utils import analyze_tool_function 
+import functools
+import threading
+import weakref
+from typing import Callable, Any, Dict, Optional, List, Mapping
+from types  import MappingProxyType, MethodType
+from .utils import analyze_tool_function, json_dumps
+
+# Simple mapping from Python types to JSON Schema types (read-only, shared by all tools)
+_PY_TO_JSON_TYPE_MAP: Mapping[str, str] = MappingProxyType({
+    'str': 'string',
+    'int': 'integer',
+    'float': 'number',
+    'bool': 'boolean',
+    'list': 'array',
+    'dict': 'object'
+})
+
+# Descriptions are normalized once, on creation, to start with one of these prefixes
+_DESCRIPTION_PREFIXES = ('A tool: ', 'An Agent: ')
+
+# Tool attributes the cached `Tool.info` schema is built from
+_INFO_FIELDS = frozenset(('name', 'description', 'parameters'))
+
+# Analysis results by function. Weak keys let the entries go away with the functions;
+# bound methods are keyed on their underlying function, as a new method object is
+# created on every attribute access.
+_ANALYSIS_CACHE: "weakref.WeakKeyDictionary[Callable, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_METHOD_ANALYSIS_CACHE: "weakref.WeakKeyDictionary[Callable, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_ANALYSIS_LOCK = threading.Lock()
+
+
+def _analyze_cached(func: Callable) -> Dict[str, Any]:
+    """Returns `analyze_tool_function(func)`, analyzing each function only once.
+
+    Every call gets its own copy of the parameter dicts, so a tool that edits
+    its parameters does not affect other tools built from the same function.
+    Callables that cannot be weakly referenced are analyzed on every call.
+    """
+    if isinstance(func, MethodType):
+        cache, key = _METHOD_ANALYSIS_CACHE, func.__func__
+    else:
+        cache, key = _ANALYSIS_CACHE, func
+
+    try:
+        with _ANALYSIS_LOCK:
+            analysis = cache.get(key)
+        if analysis is None:
+            analysis = analyze_tool_function(func)
+            with _ANALYSIS_LOCK:
+                cache[key] = analysis
+    except TypeError: # Not hashable or not weakly referenceable
+        analysis = analyze_tool_function(func)
+
+    return {
+        'docstring': analysis['docstring'],
+        'parameters': [dict(param) for param in analysis['parameters']]
+    }
 
 
 class Tool:
@@ -10,6 +65,9 @@ class Tool:
     1. (Recommended) Instantiate directly with a well-documented function, and Tool will automatically parse its metadata.
        Example: `my_tool = Tool(my_function)`
     2. (For complex cases) Inherit from this class and override the `execute` method.
+
+    A Tool holds no per-run state, so create it once (e.g. at module level) and pass the
+    same instance to every Agent or Group that uses it; its schema is then built only once.
     """
 
     def __init__(
@@ -29,56 +87,72 @@ class Tool:
             name (Optional[str]): Optional. Manually specify the tool's name. If None, the function name is used.
             description (Optional[str]): Optional. Manually specify the tool's description. If None, it's parsed from the function's docstring.
             parameters (Optional[List[Dict[str, Any]]]): Optional. Manually specify the tool's parameters. If None, they are parsed from the function's signature.
+                The function is only analyzed when `description` or `parameters` is None.
         """
         self.func = func
         
-        # 1. Use our powerful analysis function to parse metadata
-        analysis = analyze_tool_function(func)
+        # 1. Use our powerful analysis function to parse metadata (cached per function),
+        #    unless the caller supplied both the description and the parameters
+        analysis = _analyze_cached(func) if description is None or parameters is None else {}
         
         # 2. Set the core properties of the tool, allowing for manual override
         self.name: str = name or func.__name__
         self.description: str = description or analysis.get('docstring', 'No description provided.')
-        self.parameters: List[Dict[str, Any]] = parameters or analysis.get('parameters', [])
+        self.parameters: List[Dict[str, Any]] = parameters if parameters is not None else analysis.get('parameters', [])
         self.is_agent_tool = is_agent_tool
         self.is_group_tool = is_group_tool
-    
-    @property
+
+        if not self.description.startswith(_DESCRIPTION_PREFIXES):
+            self.description = f'A tool: {self.description}'
+
+    def __setattr__(self, attr: str, value: Any):
+        super().__setattr__(attr, value)
+        # The schema is derived from these attributes, so reassigning one drops the cached copy
+        if attr in _INFO_FIELDS:
+            self._invalidate_info()
+
+    def _invalidate_info(self):
+        """Drops the cached `info` schema so that it is rebuilt on the next access."""
+        self.__dict__.pop('info', None)
+        self.__dict__.pop('info_bytes', None)
+
+    @functools.cached_property
     def info(self) -> Dict[str, Any]:
         """
-        Generates a tool description dictionary compliant with the OpenAI Function Calling specification.
-        
+        Returns the tool description dictionary compliant with the OpenAI Function Calling specification.
+
+        The dictionary is built on first access and the same object is returned afterwards, until
+        `name`, `description` or `parameters` is reassigned. After mutating `parameters` in place,
+        call `_invalidate_info()` to rebuild it.
+
         Returns:
             A dictionary that can be directly serialized to JSON and sent to the LLM API.
         """
-        # 1. Build 'properties' and 'required' list
-        json_schema_properties = {}
-        required_params = []
-        # Simple mapping from Python types to JSON Schema types
-        py_to_json_type_map = {
-            'str': 'string',
-            'int': 'integer',
-            'float': 'number',
-            'bool': 'boolean',
-            'list': 'array',
-            'dict': 'object'
-        }
-        for param in self.parameters:
-            param_name = param['name']
-            
-            param_type = py_to_json_type_map.get(param.get('annotation', 'str'), 'string')
-            
-            json_schema_properties[param_name] = {
-                "type": param_type,
+        return self._build_info()
+
+    @functools.cached_property
+    def info_bytes(self) -> bytes:
+        """
+        Returns `info` serialized to compact UTF-8 JSON, cached alongside it.
+
+        Lets callers that need the schema as JSON, such as `LLMCache` keys, reuse
+        one encoding instead of serializing the dictionary on every request.
+        """
+        return json_dumps(self.info).encode('utf-8')
+
+    def _build_info(self) -> Dict[str, Any]:
+        """Builds the function-calling schema from the tool's current name, description and parameters."""
+        json_type = _PY_TO_JSON_TYPE_MAP.get # Bound once instead of per parameter
+        json_schema_properties = {
+            param['name']: {
+                "type": json_type(param.get('annotation', 'str'), 'string'),
                 "description": param.get('description', '')
             }
-            
-            if param.get('required', False):
-                required_params.append(param_name)
-        
-        if not self.description.startswith('A tool: ') and not self.description.startswith('An Agent: '):
-            self.description = f'A tool: {self.description}'
-                
-        tool_info = {
+            for param in self.parameters
+        }
+        required_params = [param['name'] for param in self.parameters if param.get('required', False)]
+
+        info: Dict[str, Any] = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -89,12 +163,11 @@ class Tool:
                 }
             }
         }
-        
+
         if required_params:
-            tool_info['function']['parameters']['required'] = required_params
-            
-        return tool_info
-    
+            info['function']['parameters']['required'] = required_params
+        return info
+
     def __call__(self, **kwargs):
         """Allows the tool instance to be called like a function."""
         return self.execute(**kwargs)
@@ -143,6 +216,9 @@ class EndTaskTool(Tool):
         # It merely returns the arguments in case it's called in an unexpected flow.
         return kwargs
 
+# The end_task schema never changes, so every Agent shares this one instance
+END_TASK_TOOL = EndTaskTool()
+
 
 import os
 import tempfile
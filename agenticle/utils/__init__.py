@@ -2,11 +2,17 @@ from typing           import Callable, Any, Dict, List, Union
 from docstring_parser import parse
 import inspect
 import os
+import json
 import base64
 
 from dotenv      import load_dotenv
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 api_key = os.getenv('API_KEY') or os.getenv('OPENAI_API_KEY') or ''
@@ -15,6 +21,40 @@ model_id = os.getenv("MODEL_ID") or ''
 platform = os.getenv("PLATFORM") or 'openai_compat'
 
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses a JSON document, using orjson when it is installed.
+
+    Documents orjson rejects but the stdlib accepts (NaN, Infinity, out-of-range floats)
+    are parsed with json.loads, so the result does not depend on the optional extra.
+    Note that orjson reads integers beyond 64 bits as floats, losing precision; parse
+    documents that may carry such integers (e.g. tool arguments) with json.loads.
+
+    Raises json.JSONDecodeError on invalid input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serializes an object to a compact JSON string, using orjson when it is installed.
+
+    Non-ASCII characters are kept as-is rather than escaped, which is shorter to send to an LLM.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # orjson rejects a few inputs json accepts (e.g. integers over 64 bits)
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
 def get_function_details(func: Callable) -> Dict[str, Any]:
     """
     检查一个函数，并以结构化的形式返回其参数和文档字符串。
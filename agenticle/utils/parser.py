@@ -1,6 +1,11 @@
 import xml.parsers.expat
+import json
+import re
+import logging
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
 
 class XmlNode:
     def __init__(self, tag, attributes=None):
@@ -99,7 +104,7 @@ class IncrementalXmlParser:
                 try:
                     callback(data)
                 except Exception as e:
-                    print(f"Error in streaming callback for tag '{target_tag}': {e}")
+                    logger.error("Error in streaming callback for tag '%s': %s", target_tag, e)
         else:
             current_node.text += data
 
@@ -116,3 +121,82 @@ class IncrementalXmlParser:
         except xml.parsers.expat.error:
             # Ignore final parsing errors if the XML is not perfectly formed
             pass
+
+
+class IncrementalJsonFieldParser:
+    """
+    Extracts the value of one string field from a JSON object that arrives in chunks.
+
+    `feed` returns the newly decoded part of the value as soon as it is available,
+    so the value can be streamed before the whole document has been received.
+    Escape sequences split across chunks are held back until they are complete.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self._key_pattern = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._in_value = False
+        self._pending = ""
+        self.done = False
+
+    def feed(self, chunk):
+        """Consumes a chunk of the JSON document and returns the newly decoded text of the field."""
+        if self.done or not chunk:
+            return ""
+
+        if not self._in_value:
+            self._buffer += chunk
+            match = self._key_pattern.search(self._buffer)
+            if not match:
+                return ""
+            self._in_value = True
+            chunk = self._buffer[match.end():]
+            self._buffer = ""
+
+        raw = self._pending + chunk
+        self._pending = ""
+        i, n = 0, len(raw)
+        while i < n:
+            char = raw[i]
+            if char == '"':
+                self.done = True
+                return self._decode(raw[:i])
+            if char == '\\':
+                size = self._escape_size(raw, i)
+                if i + size > n:
+                    # Incomplete escape sequence, wait for the next chunk
+                    self._pending = raw[i:]
+                    return self._decode(raw[:i])
+                i += size
+            else:
+                i += 1
+        return self._decode(raw)
+
+    @staticmethod
+    def _escape_size(raw, i):
+        """Returns the length of the escape sequence starting at raw[i]."""
+        if i + 1 >= len(raw):
+            return 2
+        if raw[i + 1] != 'u':
+            return 2
+        # A high surrogate must be decoded together with the low surrogate that follows it
+        if 0xD800 <= _hex_value(raw[i + 2:i + 6]) <= 0xDBFF:
+            return 12
+        return 6
+
+    @staticmethod
+    def _decode(segment):
+        if not segment:
+            return ""
+        try:
+            return json.loads('"' + segment + '"', strict=False)
+        except ValueError:
+            return segment
+
+
+def _hex_value(digits):
+    try:
+        return int(digits, 16) if len(digits) == 4 else -1
+    except ValueError:
+        return -1
@@ -20,11 +20,11 @@ def clean():
             shutil.rmtree(path)
 
     # Also remove .egg-info directories
-    for item in os.listdir(ROOT_DIR):
-        if item.endswith(".egg-info"):
-            path = os.path.join(ROOT_DIR, item)
-            print(f"Removing directory: {path}")
-            shutil.rmtree(path)
+    with os.scandir(ROOT_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".egg-info") and entry.is_dir(follow_symlinks=False):
+                print(f"Removing directory: {entry.path}")
+                shutil.rmtree(entry.path)
     
     print("--- Cleanup complete ---\n")
 
@@ -45,18 +45,19 @@ def build_package():
             command, 
             stdout=subprocess.PIPE, 
             stderr=subprocess.STDOUT, 
-            text=True, 
-            encoding='utf-8',
             cwd=ROOT_DIR
         )
 
-        # Print output in real-time
+        # Print output in real-time, forwarding whatever bytes are available
+        # instead of waiting for complete lines
+        out = sys.stdout.buffer
         while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
+            chunk = process.stdout.read1(65536)
+            if not chunk:
                 break
-            if output:
-                print(output.strip())
+            out.write(chunk)
+            out.flush()
+        process.wait()
         
         # Check for errors
         if process.returncode != 0:
@@ -1,11 +1,11 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 # Add the project root to the Python path to ensure agenticle is importable
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from agenticle import Agent, Group, Tool, Endpoint, Dashboard
+from agenticle.utils import api_key, base_url, model_id
 
 # This example requires the dashboard dependencies.
 # Install them with: pip install "agenticle[dashboard]"
@@ -25,17 +25,17 @@ def get_flight_info(destination: str):
     """Gets flight information for a specified destination. This is a shared tool."""
     return f"Flight to {destination} is available on XYZ Airline at 8:00 AM."
 
+# Tools are created once at import and shared by every agent and group that uses them
+WEATHER_TOOL = Tool(get_current_weather)
+ATTRACTION_TOOL = Tool(find_tourist_attractions)
+FLIGHT_TOOL = Tool(get_flight_info)
+
 def main():
     """
     Main function to set up a multi-agent group and run the dashboard.
     """
-    load_dotenv()
-
     # --- 1. Load configuration from .env file ---
-    api_key = os.getenv("API_KEY")
-    base_url = os.getenv("BASE_URL")
-    model_id = os.getenv("MODEL_ID")
-
+    # agenticle loads the .env file and reads these variables once on import.
     if not all([api_key, base_url, model_id]):
         print("Error: API_KEY, BASE_URL, and MODEL_ID must be set in the .env file.")
         print("Please create a .env file in the root directory with the required variables.")
@@ -51,7 +51,7 @@ def main():
         name="Weather_Specialist",
         description="Specializes in fetching weather information for a given city.",
         input_parameters=[{"name": "location"}],
-        tools=[Tool(get_current_weather)],
+        tools=[WEATHER_TOOL],
         endpoint=openai_endpoint,
         model_id=model_id,
     )
@@ -60,7 +60,7 @@ def main():
         name="Attraction_Search_Specialist",
         description="Specializes in finding tourist attractions in a city.",
         input_parameters=[{"name": "location"}],
-        tools=[Tool(find_tourist_attractions)],
+        tools=[ATTRACTION_TOOL],
         endpoint=openai_endpoint,
         model_id=model_id,
     )
@@ -80,7 +80,7 @@ def main():
         name="Travel_Agency",
         agents=[planner_agent, weather_agent, search_agent],
         manager_agent_name="Planner_Manager",
-        shared_tools=[Tool(get_flight_info)],
+        shared_tools=[FLIGHT_TOOL],
         mode='manager_delegation'
     )
 